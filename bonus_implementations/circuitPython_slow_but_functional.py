@@ -1,8 +1,10 @@
 # SPDX-FileCopyrightText: 2020 Jeff Epler for Adafruit Industries
 # SPDX-License-Identifier: MIT
 
+import os
 import random
 import time
+import bitmaptools
 import board
 import displayio
 import framebufferio
@@ -11,7 +13,7 @@ import rgbmatrix
 displayio.release_displays()
 
 # Configuration
-FADE_LEVELS = 8  # Number of fade levels for dying cells
+FADE_LEVELS = 4  # Number of fade levels for dying cells (4 packs the bitmap at 2 bits per pixel)
 FADE_DECAY_RATE = 1  # How fast cells fade (higher = faster, reduced to 1 for smoother transition)
 
 # Stability detection parameters
@@ -22,15 +24,144 @@ HISTORY_SIZE = 3
 # Colors for fade effect - Red → Green → Blue → Off
 FADE_COLORS = [
     0x000000,  # Level 0: Black (dead)
-    0x000004,  # Level 1: Very dim blue
-    0x00000A,  # Level 2: Dim blue
-    0x00000F,  # Level 3: Medium blue
-    0x000400,  # Level 4: Dim green
-    0x000A00,  # Level 5: Medium green
-    0x000F00,  # Level 6: Bright green
-    0xFF0000,  # Level 7: Bright red (alive)
+    0x00000F,  # Level 1: Medium blue
+    0x000F00,  # Level 2: Bright green
+    0xFF0000,  # Level 3: Bright red (alive)
 ]
 
+# Byte value -> positions of its set bits, least significant first
+BIT_POSITIONS = [tuple(i for i in range(8) if (b >> i) & 1) for b in range(256)]
+
+# Byte value -> number of set bits
+POPCOUNT = bytes(len(bits) for bits in BIT_POSITIONS)
+
+# Byte value -> its 8 cells as palette indices (alive at full brightness)
+ALIVE_PIXELS = [
+    bytes(FADE_LEVELS - 1 if (b >> i) & 1 else 0 for i in range(8))
+    for b in range(256)
+]
+
+# Source of the generation step. __init__ fills in this board's constants and
+# compiles it, so the hot loops see literal ints rather than locals or attributes.
+# Literal braces are doubled so str.format only touches the placeholders.
+STEP_TEMPLATE = """
+def step(self):
+    # Apply Conway's rules with fade effect
+    frame = self.frame
+    alive_bits = self.alive_bits
+    padded = self.padded
+    row_ones = self.row_ones
+    row_twos = self.row_twos
+    from_bytes = int.from_bytes
+    popcount = POPCOUNT
+    bit_positions = BIT_POSITIONS
+
+    # Dim every dead cell that is still lit and drop the ones that reach 0;
+    # cells reborn this generation are repainted below
+    fading = {{}}
+    for cell_index, level in self.fading.items():
+        level -= {decay}
+        if level > 0:
+            fading[cell_index] = level
+            frame[cell_index] = level
+        else:
+            frame[cell_index] = 0
+
+    # Unpack the alive mask into the padded rows and sum each row's west,
+    # own and east columns, then mirror the top and bottom edges so every
+    # row has a neighbour above and below
+    for y in range({height}):
+        row = from_bytes(alive_bits[y * {row_bytes}:(y + 1) * {row_bytes}], "little")
+
+        # Pad the row with a wrapped column on each side, so bit x of wide is
+        # column x - 1 and bit x of wide >> 2 is column x + 1
+        wide = (row << 1) | (row >> {width_minus_1}) | ((row & 1) << {width_plus_1})
+        west = wide & {row_mask}
+        east = wide >> 2
+
+        padded[y + 1] = row
+        row_ones[y + 1] = west ^ row ^ east
+        row_twos[y + 1] = (west & row) | (east & (west | row))
+    padded[0] = padded[{height}]
+    padded[{height_plus_1}] = padded[1]
+    row_ones[0] = row_ones[{height}]
+    row_ones[{height_plus_1}] = row_ones[1]
+    row_twos[0] = row_twos[{height}]
+    row_twos[{height_plus_1}] = row_twos[1]
+
+    # Only rows next to last generation's changes can change now; a band
+    # touching an edge wraps around, so just take the whole board then
+    band_start = self.dirty_miny
+    band_end = self.dirty_maxy + 2
+    if band_start < 1 or band_end > {height}:
+        band_start = 1
+        band_end = {height}
+    dirty_miny = {height}
+    dirty_maxy = -1
+    live_count = self.live_count
+
+    for y in range(band_start, band_end + 1):
+        mid = padded[y]
+        up_s = row_ones[y - 1]
+        up_c = row_twos[y - 1]
+        mid_s = row_ones[y]
+        mid_c = row_twos[y]
+        down_s = row_ones[y + 1]
+        down_c = row_twos[y + 1]
+
+        # Add the three row sums: a 9-cell total (cell included) per lane,
+        # as a ones bit plus a count of weight-2 carries
+        ones = up_s ^ mid_s ^ down_s
+        ones_c = (up_s & mid_s) | (down_s & (up_s | mid_s))
+        pair_x = up_c ^ down_c
+        pair_a = up_c & down_c
+        quad_x = mid_c ^ ones_c
+        quad_a = mid_c & ones_c
+
+        # Total of 3: ones bit and exactly one carry
+        # Total of 4: no ones bit and exactly two carries
+        three = ones & (pair_x ^ quad_x) & ~(pair_a | quad_a)
+        four = (((pair_a ^ quad_a) & ~(pair_x | quad_x)) | (pair_x & quad_x)) & ~ones
+
+        # Apply Conway's rules: a total of 3, or 4 with the cell alive
+        new_row = three | (four & mid)
+        if new_row == mid:
+            continue
+
+        if dirty_miny == {height}:
+            dirty_miny = y - 1
+        dirty_maxy = y - 1
+
+        # Store the next generation's alive mask and repaint only the cells
+        # that were born or died, byte by byte
+        # (padded already holds this generation, so writing in place is safe)
+        y_offset = (y - 1) * {width}
+        row_data = new_row.to_bytes({row_bytes}, "little")
+        old_data = alive_bits[(y - 1) * {row_bytes}:y * {row_bytes}]
+        for j in range({row_bytes}):
+            new_byte = row_data[j]
+            old_byte = old_data[j]
+            if new_byte == old_byte:
+                continue
+            live_count += popcount[new_byte] - popcount[old_byte]
+            base = y_offset + 8 * j
+            for bit in bit_positions[new_byte & ~old_byte]:
+                fading.pop(base + bit, None)
+                frame[base + bit] = {max_fade}
+            for bit in bit_positions[old_byte & ~new_byte]:
+                fading[base + bit] = {first_fade}
+                frame[base + bit] = {first_fade}
+        alive_bits[(y - 1) * {row_bytes}:y * {row_bytes}] = row_data
+
+    self.fading = fading
+    self.dirty_miny = dirty_miny
+    self.dirty_maxy = dirty_maxy
+    self.live_count = live_count
+
+    # Push the finished frame to the display bitmap
+    self.blit(frame, self.b1)
+"""
+
 class GameOfLifeMatrix:
     def __init__(self, matrix, display):
         self.matrix = matrix
@@ -38,30 +169,54 @@ class GameOfLifeMatrix:
         self.width = display.width
         self.height = display.height
 
-        # Create bitmaps for double buffering
+        # Create the bitmap; the matrix is already double buffered
+        # (doublebuffer=True), so frames are blitted into this one bitmap
         self.b1 = displayio.Bitmap(self.width, self.height, FADE_LEVELS)
-        self.b2 = displayio.Bitmap(self.width, self.height, FADE_LEVELS)
 
         # Create palette with fade colors
         self.palette = displayio.Palette(FADE_LEVELS)
         for i in range(FADE_LEVELS):
             self.palette[i] = FADE_COLORS[i]
 
-        # Create tile grids and groups
+        # Create tile grid and group
         self.tg1 = displayio.TileGrid(self.b1, pixel_shader=self.palette)
-        self.tg2 = displayio.TileGrid(self.b2, pixel_shader=self.palette)
         self.g1 = displayio.Group()
         self.g1.append(self.tg1)
-        self.g2 = displayio.Group()
-        self.g2.append(self.tg2)
 
         # Set initial display
         self.display.root_group = self.g1
-        self.current_bitmap = self.b1
-        self.next_bitmap = self.b2
 
-        # Fade buffer to track fade levels
-        self.fade_buffer = bytearray(self.width * self.height)
+        # Frame buffer, one palette index per cell; only cells whose level
+        # changes are written, and the frame is copied into the bitmap once
+        # per generation
+        self.frame = bytearray(self.width * self.height)
+
+        # Bit-packed alive mask, one bit per cell
+        # Each row is row_bytes little-endian bytes, so bit x of a row is column x
+        if self.width % 8:
+            raise ValueError("Display width must be a multiple of 8")
+        self.row_bytes = self.width // 8
+        self.alive_bits = bytearray(self.width * self.height // 8)
+
+        # Fade level of each dead cell that is still lit, by cell index;
+        # usually a small fraction of the board
+        self.fading = {}
+
+        # Toroidally padded copy of the alive mask, one int per row: rows 0 and
+        # height + 1 mirror the opposite edges. row_ones/row_twos hold each row's
+        # horizontal 3-cell sums (bits 0 and 1 of every lane), padded the same way,
+        # so each row's sum is computed once and shared by the three rows using it
+        self.padded = [0] * (self.height + 2)
+        self.row_ones = [0] * (self.height + 2)
+        self.row_twos = [0] * (self.height + 2)
+
+        # Dirty band: first/last row whose alive cells changed last generation
+        # (empty when dirty_miny > dirty_maxy). Rows outside it can't change.
+        self.dirty_miny = 0
+        self.dirty_maxy = self.height - 1
+
+        # Population, kept current as cells are born and die
+        self.live_count = 0
 
         # Stability tracking
         if AUTO_RESET_ON_STABLE:
@@ -71,99 +226,80 @@ class GameOfLifeMatrix:
 
         # Pre-calculate for optimization
         self.width_minus_1 = self.width - 1
-        self.height_minus_1 = self.height - 1
+        self.row_mask = (1 << self.width) - 1
+
+        # Compile the generation step with the board constants baked in
+        namespace = {}
+        exec(
+            STEP_TEMPLATE.format(
+                width=self.width,
+                width_minus_1=self.width_minus_1,
+                width_plus_1=self.width + 1,
+                height=self.height,
+                height_plus_1=self.height + 1,
+                row_bytes=self.row_bytes,
+                row_mask=hex(self.row_mask),
+                max_fade=FADE_LEVELS - 1,
+                first_fade=max(0, FADE_LEVELS - 1 - FADE_DECAY_RATE),
+                decay=FADE_DECAY_RATE,
+            ),
+            globals(),
+            namespace,
+        )
+        step = namespace["step"]
+        self.apply_life_rule_with_fade = lambda: step(self)
 
     def randomize(self, fraction=0.33):
         """Initialize board with random pattern"""
-        random_threshold = int(fraction * 32767)
+        random_threshold = int(fraction * 256)
         size = self.width * self.height
-
-        # Randomize current bitmap
-        for i in range(size):
-            if random.getrandbits(15) < random_threshold:
-                self.current_bitmap[i] = FADE_LEVELS - 1  # Full brightness
-                self.fade_buffer[i] = FADE_LEVELS - 1
-            else:
-                self.current_bitmap[i] = 0
-                self.fade_buffer[i] = 0
-
-    def apply_life_rule_with_fade(self):
-        """Apply Conway's rules with fade effect"""
-        width = self.width
-        height = self.height
-        current = self.current_bitmap
-        next_bmp = self.next_bitmap
-        fade = self.fade_buffer
-
-        # Pre-calculate constants
-        width_minus_1 = self.width_minus_1
-        height_minus_1 = self.height_minus_1
-        max_fade = FADE_LEVELS - 1
-
-        for y in range(height):
-            # Calculate row offsets once per row
-            y_offset = y * width
-
-            # Calculate wrapped y coordinates
-            if y == 0:
-                ym1_offset = height_minus_1 * width
-            else:
-                ym1_offset = (y - 1) * width
-
-            if y == height_minus_1:
-                yp1_offset = 0
-            else:
-                yp1_offset = (y + 1) * width
-
-            # Process row
-            x_minus_1 = width_minus_1
-
-            for x in range(width):
-                # Calculate wrapped x coordinates
-                if x == width_minus_1:
-                    x_plus_1 = 0
-                else:
-                    x_plus_1 = x + 1
-
-                # Count living neighbors (only fully alive cells count)
-                neighbors = 0
-                if current[x_minus_1 + ym1_offset] == max_fade: neighbors += 1
-                if current[x + ym1_offset] == max_fade: neighbors += 1
-                if current[x_plus_1 + ym1_offset] == max_fade: neighbors += 1
-                if current[x_minus_1 + y_offset] == max_fade: neighbors += 1
-                if current[x_plus_1 + y_offset] == max_fade: neighbors += 1
-                if current[x_minus_1 + yp1_offset] == max_fade: neighbors += 1
-                if current[x + yp1_offset] == max_fade: neighbors += 1
-                if current[x_plus_1 + yp1_offset] == max_fade: neighbors += 1
-
-                # Apply Conway's rules
-                cell_index = x + y_offset
-                cell_alive = current[cell_index] == max_fade
-
-                if (neighbors == 3) or (neighbors == 2 and cell_alive):
-                    # Cell lives/is born
-                    next_bmp[cell_index] = max_fade
-                    fade[cell_index] = max_fade
-                else:
-                    # Cell dies or stays dead - apply fade
-                    if fade[cell_index] > 0:
-                        fade[cell_index] = max(0, fade[cell_index] - FADE_DECAY_RATE)
-                    next_bmp[cell_index] = fade[cell_index]
-
-                # Update x_minus_1 for next iteration
-                x_minus_1 = x
+        frame = self.frame
+        alive_bits = self.alive_bits
+        alive_pixels = ALIVE_PIXELS
+        popcount = POPCOUNT
+        live_count = 0
+
+        # One random byte per cell from a single call; ports without a
+        # hardware RNG fall back to the PRNG, four bytes per call
+        try:
+            noise = os.urandom(size)
+        except NotImplementedError:
+            getrandbits = random.getrandbits
+            noise = bytearray(size)
+            for i in range(0, size, 4):
+                noise[i:i + 4] = getrandbits(32).to_bytes(4, "little")
+
+        # Randomize the alive mask 8 cells at a time and paint each byte's cells
+        for byte_index in range(len(alive_bits)):
+            base = byte_index * 8
+            bits = 0
+            for bit in range(8):
+                if noise[base + bit] < random_threshold:
+                    bits |= 1 << bit
+            alive_bits[byte_index] = bits
+            frame[base:base + 8] = alive_pixels[bits]
+            live_count += popcount[bits]
+
+        self.live_count = live_count
+
+        # Every row is new, and nothing is fading yet
+        self.fading = {}
+        self.dirty_miny = 0
+        self.dirty_maxy = self.height - 1
+
+        self.blit(frame, self.b1)
+
+    def blit(self, buf, bitmap):
+        """Copy a frame buffer into a bitmap"""
+        # Single C-level copy; arrayblit packs the bytes to the bitmap's bit depth
+        # (a raw memoryview copy would not, as 4 levels are stored 2 bits per pixel)
+        # and marks the bitmap dirty for the next refresh
+        bitmaptools.arrayblit(bitmap, buf)
 
     def count_population(self):
         """Count fully alive cells"""
-        count = 0
-        max_fade = FADE_LEVELS - 1
-        size = self.width * self.height
-
-        for i in range(size):
-            if self.current_bitmap[i] == max_fade:
-                count += 1
-
-        return count
+        # Maintained by randomize and apply_life_rule_with_fade
+        return self.live_count
 
     def check_stability(self, current_pop):
         """Check if the population has stabilized"""
@@ -198,7 +334,7 @@ class GameOfLifeMatrix:
         if not AUTO_RESET_ON_STABLE:
             return
 
-        current_pop = self.count_population()
+        current_pop = self.live_count
 
         if self.check_stability(current_pop):
             self.stable_count += 1
@@ -228,13 +364,6 @@ class GameOfLifeMatrix:
             # Apply rules with fade
             self.apply_life_rule_with_fade()
 
-            # Swap buffers
-            self.current_bitmap, self.next_bitmap = self.next_bitmap, self.current_bitmap
-            if self.display.root_group == self.g1:
-                self.display.root_group = self.g2
-            else:
-                self.display.root_group = self.g1
-
             # Check for stability
             # self.handle_stable_state()
 
@@ -0,0 +1,31 @@
+from collections import defaultdict
+
+# Offsets of the 8 neighbors around a cell
+NEIGHBORS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+def step(live, size):
+    """Advance a set of live (x, y) cells on a wrap-around board by one generation"""
+    # Only live cells and their neighbors (the candidates) can be alive next
+    counts = defaultdict(int)
+    for x, y in live:
+        for dx, dy in NEIGHBORS:
+            counts[(x + dx) % size, (y + dy) % size] += 1
+
+    return {cell for cell, n in counts.items() if n == 3 or (n == 2 and cell in live)}
+
+
+def run_until_stable(live, size, max_generations):
+    """Generations until the board repeats with period 1 or 2"""
+    prev1 = prev2 = live
+
+    for generation in range(1, max_generations + 1):
+        live = step(live, size)
+
+        if live == prev1 or live == prev2:
+            return generation
+
+        prev2 = prev1
+        prev1 = live
+
+    return max_generations
@@ -0,0 +1,193 @@
+from collections import namedtuple
+from functools import lru_cache
+from itertools import count
+
+# Clear the caches once they hold this many nodes, checked every generation
+CACHE_LIMIT = 2000000
+
+
+# Quadtree node covering 2^k x 2^k cells. Nodes are hash-consed, so equal
+# boards are the same object; hash is a unique id used for hashing and
+# equality, which keeps the caches below from walking whole trees.
+class Node(namedtuple("Node", "nw ne sw se k hash pop")):
+    __slots__ = ()
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+
+OFF = Node(None, None, None, None, 0, 0, 0)
+ON = Node(None, None, None, None, 0, 1, 1)
+
+_ids = count(2)
+
+# (nw, ne, sw, se) ids -> the one Node with those children
+cache = {}
+
+
+def join(nw, ne, sw, se):
+    """Return the canonical node with the given quadrants"""
+    key = (nw.hash, ne.hash, sw.hash, se.hash)
+    node = cache.get(key)
+    if node is None:
+        node = Node(nw, ne, sw, se, nw.k + 1, next(_ids), nw.pop + ne.pop + sw.pop + se.pop)
+        cache[key] = node
+    return node
+
+
+def clear_caches():
+    """Drop all memoized nodes and results; only call between runs, as boards
+    built before no longer compare equal to ones built after"""
+    cache.clear()
+    result.cache_clear()
+
+
+@lru_cache(maxsize=65536)
+def _life_4x4(bits):
+    """Centre 2x2 of a 4x4 block after one generation; bit y * 4 + x is cell (x, y)"""
+    out = 0
+    for y in (1, 2):
+        for x in (1, 2):
+            neighbors = 0
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if dx or dy:
+                        neighbors += (bits >> ((y + dy) * 4 + x + dx)) & 1
+            alive = (bits >> (y * 4 + x)) & 1
+            if neighbors == 3 or (neighbors == 2 and alive):
+                out |= 1 << ((y - 1) * 2 + (x - 1))
+    return out
+
+
+def _leaf_bits(node):
+    """Pack a level-2 node into 16 bits, bit y * 4 + x for cell (x, y)"""
+    bits = 0
+    for qy, (west, east) in enumerate(((node.nw, node.ne), (node.sw, node.se))):
+        for qx, quad in enumerate((west, east)):
+            for i, leaf in enumerate((quad.nw, quad.ne, quad.sw, quad.se)):
+                x = qx * 2 + (i & 1)
+                y = qy * 2 + (i >> 1)
+                bits |= leaf.pop << (y * 4 + x)
+    return bits
+
+
+@lru_cache(maxsize=None)
+def result(node, j):
+    """Centre 2^(k-1) square of node after 2^j generations (j <= k - 2)"""
+    if node.pop == 0:
+        return node.nw
+
+    if node.k == 2:
+        bits = _life_4x4(_leaf_bits(node))
+        leaves = [ON if (bits >> i) & 1 else OFF for i in range(4)]
+        return join(*leaves)
+
+    nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+    # Nine overlapping sub-squares, each advanced by up to half the step
+    half = min(j, node.k - 3)
+    c1 = result(nw, half)
+    c2 = result(join(nw.ne, ne.nw, nw.se, ne.sw), half)
+    c3 = result(ne, half)
+    c4 = result(join(nw.sw, nw.se, sw.nw, sw.ne), half)
+    c5 = result(join(nw.se, ne.sw, sw.ne, se.nw), half)
+    c6 = result(join(ne.sw, ne.se, se.nw, se.ne), half)
+    c7 = result(sw, half)
+    c8 = result(join(sw.ne, se.nw, sw.se, se.sw), half)
+    c9 = result(se, half)
+
+    if j < node.k - 2:
+        # The nine results already cover all 2^j generations; take their centres
+        return join(
+            join(c1.se, c2.sw, c4.ne, c5.nw),
+            join(c2.se, c3.sw, c5.ne, c6.nw),
+            join(c4.se, c5.sw, c7.ne, c8.nw),
+            join(c5.se, c6.sw, c8.ne, c9.nw),
+        )
+
+    # Advance the four combined quadrants by the second half of the step
+    return join(
+        result(join(c1, c2, c4, c5), half),
+        result(join(c2, c3, c5, c6), half),
+        result(join(c4, c5, c7, c8), half),
+        result(join(c5, c6, c8, c9), half),
+    )
+
+
+def from_cells(live, size):
+    """Build a size x size board (size a power of 2) from a set of (x, y) cells"""
+    def build(x, y, side):
+        if side == 1:
+            return ON if (x, y) in live else OFF
+        half = side // 2
+        return join(
+            build(x, y, half), build(x + half, y, half),
+            build(x, y + half, half), build(x + half, y + half, half),
+        )
+
+    return build(0, 0, size)
+
+
+def to_cells(board):
+    """Set of (x, y) live cells of a board"""
+    live = set()
+
+    def collect(node, x, y):
+        if node.pop == 0:
+            return
+        if node.k == 0:
+            live.add((x, y))
+            return
+        half = 1 << (node.k - 1)
+        collect(node.nw, x, y)
+        collect(node.ne, x + half, y)
+        collect(node.sw, x, y + half)
+        collect(node.se, x + half, y + half)
+
+    collect(board, 0, 0)
+    return live
+
+
+def step_torus(board):
+    """Advance a wrap-around board by one generation"""
+    # Tile the board so a 2x-wide node is centred on it: each quadrant of the
+    # tile is the board shifted by half, and the centre of the result is the
+    # board's own window one generation later
+    tile = join(board.se, board.sw, board.ne, board.nw)
+    return result(join(tile, tile, tile, tile), 0)
+
+
+def run_until_stable(live, size, max_generations):
+    """Generations until the board repeats with period 1 or 2"""
+    if size < 2 or size & (size - 1):
+        raise ValueError("Hashlife board size must be a power of 2")
+
+    board = from_cells(live, size)
+    prev1 = prev2 = board
+
+    for generation in range(1, max_generations + 1):
+        board = step_torus(board)
+
+        # Canonical nodes make the state comparison an identity check
+        if board is prev1 or board is prev2:
+            return generation
+
+        prev2 = prev1
+        prev1 = board
+
+        if len(cache) > CACHE_LIMIT:
+            # Keep only the two boards still needed for the comparison; nodes
+            # built before a clear don't compare equal to ones built after
+            cells1 = to_cells(prev1)
+            cells2 = to_cells(prev2)
+            clear_caches()
+            board = prev1 = from_cells(cells1, size)
+            prev2 = from_cells(cells2, size)
+
+    return max_generations
@@ -0,0 +1,60 @@
+import numpy as np
+from numba import njit, prange
+
+from gol_numpy import FADE_DECAY_RATE, FADE_LEVELS, GameOfLifeNumpy
+
+
+@njit(cache=True, boundscheck=False, parallel=True)
+def step(alive, fade, out_alive, out_fade, max_fade, decay):
+    """Apply Conway's rules with fade effect from alive/fade into out_alive/out_fade"""
+    h, w = alive.shape
+
+    for y in prange(h):
+        # Calculate wrapped y coordinates
+        ym = h - 1 if y == 0 else y - 1
+        yp = 0 if y == h - 1 else y + 1
+
+        for x in range(w):
+            # Calculate wrapped x coordinates
+            xm = w - 1 if x == 0 else x - 1
+            xp = 0 if x == w - 1 else x + 1
+
+            n = (
+                alive[ym, xm] + alive[ym, x] + alive[ym, xp]
+                + alive[y, xm] + alive[y, xp]
+                + alive[yp, xm] + alive[yp, x] + alive[yp, xp]
+            )
+
+            if n == 3 or (n == 2 and alive[y, x]):
+                # Cell lives/is born
+                out_alive[y, x] = 1
+                out_fade[y, x] = max_fade
+            else:
+                # Cell dies or stays dead - apply fade
+                out_alive[y, x] = 0
+                f = fade[y, x]
+                out_fade[y, x] = f - decay if f > decay else 0
+
+
+class GameOfLifeNumba(GameOfLifeNumpy):
+    def __init__(self, width=64, height=64):
+        super().__init__(width, height)
+
+        # Output buffers are allocated once and swapped with the inputs each step
+        self.out_alive = np.zeros((height, width), dtype=np.uint8)
+        self.out_fade = np.zeros((height, width), dtype=np.uint8)
+
+    def apply_life_rule_with_fade(self):
+        """Apply Conway's rules with fade effect"""
+        step(
+            self.alive, self.fade_buffer, self.out_alive, self.out_fade,
+            FADE_LEVELS - 1, FADE_DECAY_RATE,
+        )
+
+        # Swap buffers
+        self.alive, self.out_alive = self.out_alive, self.alive
+        self.fade_buffer, self.out_fade = self.out_fade, self.fade_buffer
+
+
+if __name__ == "__main__":
+    GameOfLifeNumba(32, 32).run()
@@ -0,0 +1,119 @@
+import sys
+import time
+
+import numpy as np
+
+# SciPy is optional; without it neighbors are summed with np.roll
+try:
+    from scipy.signal import convolve2d
+except ImportError:
+    convolve2d = None
+
+# Configuration (matches the CircuitPython version)
+FADE_LEVELS = 4  # Number of fade levels for dying cells
+FADE_DECAY_RATE = 1  # How fast cells fade
+FRAME_DELAY = 0.1  # Seconds between generations when run in the console
+
+# Characters for each fade level, dead to alive (off, blue, green, red on the matrix)
+FADE_CHARS = ["  ", "· ", "∘ ", "● "]
+
+# Weights of the 8 neighbors around a cell
+NEIGHBOR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+
+
+class GameOfLifeNumpy:
+    def __init__(self, width=64, height=64):
+        self.width = width
+        self.height = height
+
+        # Alive mask (0/1) and fade levels, one byte per cell
+        self.alive = np.zeros((height, width), dtype=np.uint8)
+        self.fade_buffer = np.zeros((height, width), dtype=np.uint8)
+
+    def randomize(self, fraction=0.33, rng=None):
+        """Initialize board with random pattern"""
+        if rng is None:
+            rng = np.random.default_rng()
+
+        self.alive = (rng.random((self.height, self.width)) < fraction).astype(np.uint8)
+        self.fade_buffer = self.alive * np.uint8(FADE_LEVELS - 1)
+
+    def load_cells(self, live):
+        """Set the board to a set of live (x, y) cells"""
+        alive = np.zeros((self.height, self.width), dtype=np.uint8)
+        if live:
+            cells = np.array(list(live))
+            alive[cells[:, 1], cells[:, 0]] = 1
+
+        self.alive = alive
+        self.fade_buffer = alive * np.uint8(FADE_LEVELS - 1)
+
+    def count_neighbors(self):
+        """Count living neighbors of every cell with wrapping"""
+        a = self.alive
+
+        if convolve2d is not None:
+            return convolve2d(a, NEIGHBOR_KERNEL, mode="same", boundary="wrap")
+
+        up = np.roll(a, 1, 0)
+        down = np.roll(a, -1, 0)
+        return (
+            up + down
+            + np.roll(a, 1, 1) + np.roll(a, -1, 1)
+            + np.roll(up, 1, 1) + np.roll(up, -1, 1)
+            + np.roll(down, 1, 1) + np.roll(down, -1, 1)
+        )
+
+    def apply_life_rule_with_fade(self):
+        """Apply Conway's rules with fade effect"""
+        a = self.alive
+        n = self.count_neighbors()
+
+        # Cell lives/is born on 3 neighbors, or survives on 2
+        new = ((n == 3) | ((a == 1) & (n == 2))).astype(np.uint8)
+
+        # Dying and dead cells fade toward 0
+        decayed = np.maximum(self.fade_buffer.astype(np.int16) - FADE_DECAY_RATE, 0)
+        self.fade_buffer = np.where(new == 1, FADE_LEVELS - 1, decayed).astype(np.uint8)
+        self.alive = new
+
+    def count_population(self):
+        """Count fully alive cells"""
+        return int(np.count_nonzero(self.alive))
+
+    def run_until_stable(self, max_generations):
+        """Generations until the board repeats with period 1 or 2"""
+        # Copies, as the faster subclasses reuse their buffers between steps
+        prev1 = prev2 = self.alive.copy()
+
+        for generation in range(1, max_generations + 1):
+            self.apply_life_rule_with_fade()
+            alive = self.alive
+
+            if np.array_equal(alive, prev1) or np.array_equal(alive, prev2):
+                return generation
+
+            prev2 = prev1
+            prev1 = alive.copy()
+
+        return max_generations
+
+    def render(self):
+        """Draw the board to the console"""
+        rows = ["".join(FADE_CHARS[level] for level in row) for row in self.fade_buffer]
+        sys.stdout.write("\033[H" + "\n".join(rows) + "\n")
+        sys.stdout.flush()
+
+    def run(self):
+        """Main game loop"""
+        self.randomize(0.33)
+        sys.stdout.write("\033[2J")
+
+        while True:
+            self.render()
+            self.apply_life_rule_with_fade()
+            time.sleep(FRAME_DELAY)
+
+
+if __name__ == "__main__":
+    GameOfLifeNumpy(32, 32).run()
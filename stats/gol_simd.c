@@ -0,0 +1,157 @@
+// Bit-packed Game of Life step with fade, using AVX2 when available.
+//
+// Rows are w_bytes long and little-endian, so bit x of a row is column x.
+// w_bytes must be a multiple of 8 (whole 64-bit words).
+//
+// Build as a shared library for gol_simd.py:
+//   gcc -O3 -march=native -shared -fPIC -o libgol_simd.so gol_simd.c
+
+#include <stdint.h>
+#include <string.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+// Conway's rule on one word of lanes, given each row's west/centre/east bits.
+// Each row is reduced to a 2-bit sum by a half/full adder, then the three sums
+// are combined; exactly one weight-2 carry means 2 or 3 neighbors.
+static inline uint64_t life_word(uint64_t uw, uint64_t um, uint64_t ue,
+                                 uint64_t mw, uint64_t mm, uint64_t me,
+                                 uint64_t dw, uint64_t dm, uint64_t de)
+{
+    uint64_t up_s = uw ^ um ^ ue;
+    uint64_t up_c = (uw & um) | (uw & ue) | (um & ue);
+    uint64_t mid_s = mw ^ me;
+    uint64_t mid_c = mw & me;
+    uint64_t down_s = dw ^ dm ^ de;
+    uint64_t down_c = (dw & dm) | (dw & de) | (dm & de);
+
+    uint64_t ones = up_s ^ mid_s ^ down_s;
+    uint64_t ones_c = (up_s & mid_s) | (up_s & down_s) | (mid_s & down_s);
+    uint64_t pair_x = up_c ^ down_c;
+    uint64_t pair_a = up_c & down_c;
+    uint64_t quad_x = mid_c ^ ones_c;
+    uint64_t quad_a = mid_c & ones_c;
+
+    return (pair_x ^ quad_x) & ~(pair_a | quad_a) & (ones | mm);
+}
+
+#ifdef __AVX2__
+static inline __m256i maj256(__m256i a, __m256i b, __m256i c)
+{
+    return _mm256_or_si256(_mm256_and_si256(a, b),
+                           _mm256_and_si256(c, _mm256_or_si256(a, b)));
+}
+
+// Same as life_word on four words (256 cells) at once
+static inline __m256i life_vec(__m256i uw, __m256i um, __m256i ue,
+                               __m256i mw, __m256i mm, __m256i me,
+                               __m256i dw, __m256i dm, __m256i de)
+{
+    __m256i up_s = _mm256_xor_si256(_mm256_xor_si256(uw, um), ue);
+    __m256i up_c = maj256(uw, um, ue);
+    __m256i mid_s = _mm256_xor_si256(mw, me);
+    __m256i mid_c = _mm256_and_si256(mw, me);
+    __m256i down_s = _mm256_xor_si256(_mm256_xor_si256(dw, dm), de);
+    __m256i down_c = maj256(dw, dm, de);
+
+    __m256i ones = _mm256_xor_si256(_mm256_xor_si256(up_s, mid_s), down_s);
+    __m256i ones_c = maj256(up_s, mid_s, down_s);
+    __m256i pair_x = _mm256_xor_si256(up_c, down_c);
+    __m256i pair_a = _mm256_and_si256(up_c, down_c);
+    __m256i quad_x = _mm256_xor_si256(mid_c, ones_c);
+    __m256i quad_a = _mm256_and_si256(mid_c, ones_c);
+
+    __m256i two_or_three = _mm256_andnot_si256(_mm256_or_si256(pair_a, quad_a),
+                                               _mm256_xor_si256(pair_x, quad_x));
+    return _mm256_and_si256(two_or_three, _mm256_or_si256(ones, mm));
+}
+
+// West (x - 1) and east (x + 1) neighbors of four words of a padded row
+static inline __m256i west256(const uint64_t *row)
+{
+    return _mm256_or_si256(_mm256_slli_epi64(_mm256_loadu_si256((const __m256i *)row), 1),
+                           _mm256_srli_epi64(_mm256_loadu_si256((const __m256i *)(row - 1)), 63));
+}
+
+static inline __m256i east256(const uint64_t *row)
+{
+    return _mm256_or_si256(_mm256_srli_epi64(_mm256_loadu_si256((const __m256i *)row), 1),
+                           _mm256_slli_epi64(_mm256_loadu_si256((const __m256i *)(row + 1)), 63));
+}
+#endif
+
+// Advance one generation. alive_bits/out_bits are h rows of w_bytes packed
+// cells; fade/out_fade hold one fade level per cell (w_bytes * 8 per row).
+// padded and result are caller-owned scratch space, reused across calls:
+// (h + 2) * (w_bytes / 8 + 2) and w_bytes / 8 words respectively.
+// Returns 0 on success, -1 on bad arguments.
+int step(const uint8_t *alive_bits, int w_bytes, int h,
+         uint8_t *out_bits, uint8_t *out_fade, const uint8_t *fade,
+         int max_fade, int decay, uint64_t *padded, uint64_t *result)
+{
+    if (w_bytes <= 0 || w_bytes % 8 != 0 || h <= 0)
+        return -1;
+
+    int words = w_bytes / 8;
+    int stride = words + 2;
+    int width = w_bytes * 8;
+
+    // Toroidally padded copy: one extra word on each side of a row and one
+    // extra row above and below, each mirroring the opposite edge
+    for (int y = 0; y < h; y++)
+    {
+        uint64_t *row = padded + (size_t)(y + 1) * stride;
+        memcpy(row + 1, alive_bits + (size_t)y * w_bytes, w_bytes);
+        row[0] = row[words];
+        row[words + 1] = row[1];
+    }
+    memcpy(padded, padded + (size_t)h * stride, stride * sizeof(uint64_t));
+    memcpy(padded + (size_t)(h + 1) * stride, padded + stride, stride * sizeof(uint64_t));
+
+    for (int y = 0; y < h; y++)
+    {
+        // Point at the first real word of each row
+        const uint64_t *up = padded + (size_t)y * stride + 1;
+        const uint64_t *mid = up + stride;
+        const uint64_t *down = mid + stride;
+        int i = 0;
+
+#ifdef __AVX2__
+        for (; i + 4 <= words; i += 4)
+        {
+            __m256i next = life_vec(
+                west256(up + i), _mm256_loadu_si256((const __m256i *)(up + i)), east256(up + i),
+                west256(mid + i), _mm256_loadu_si256((const __m256i *)(mid + i)), east256(mid + i),
+                west256(down + i), _mm256_loadu_si256((const __m256i *)(down + i)), east256(down + i));
+            _mm256_storeu_si256((__m256i *)(result + i), next);
+        }
+#endif
+
+        // Scalar tail (or the whole row without AVX2)
+        for (; i < words; i++)
+        {
+            result[i] = life_word(
+                (up[i] << 1) | (up[i - 1] >> 63), up[i], (up[i] >> 1) | (up[i + 1] << 63),
+                (mid[i] << 1) | (mid[i - 1] >> 63), mid[i], (mid[i] >> 1) | (mid[i + 1] << 63),
+                (down[i] << 1) | (down[i - 1] >> 63), down[i], (down[i] >> 1) | (down[i + 1] << 63));
+        }
+
+        memcpy(out_bits + (size_t)y * w_bytes, result, w_bytes);
+
+        // Alive cells go to full brightness, everything else fades
+        const uint8_t *fade_row = fade + (size_t)y * width;
+        uint8_t *out_fade_row = out_fade + (size_t)y * width;
+        for (int x = 0; x < width; x++)
+        {
+            int level = fade_row[x];
+            if ((result[x >> 6] >> (x & 63)) & 1)
+                out_fade_row[x] = (uint8_t)max_fade;
+            else
+                out_fade_row[x] = (uint8_t)(level > decay ? level - decay : 0);
+        }
+    }
+
+    return 0;
+}
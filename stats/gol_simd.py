@@ -0,0 +1,80 @@
+import ctypes
+import os
+
+import numpy as np
+
+from gol_numba import GameOfLifeNumba
+from gol_numpy import FADE_DECAY_RATE, FADE_LEVELS
+
+# Built from gol_simd.c; see the build line at the top of that file
+LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libgol_simd.so")
+
+try:
+    _lib = ctypes.CDLL(LIBRARY_PATH)
+except OSError:
+    _lib = None
+else:
+    _u8 = np.ctypeslib.ndpointer(dtype=np.uint8, flags="C_CONTIGUOUS")
+    _u64 = np.ctypeslib.ndpointer(dtype=np.uint64, flags="C_CONTIGUOUS")
+    _lib.step.argtypes = [
+        _u8, ctypes.c_int, ctypes.c_int, _u8, _u8, _u8, ctypes.c_int, ctypes.c_int, _u64, _u64,
+    ]
+    _lib.step.restype = ctypes.c_int
+
+# Byte value -> number of set bits
+POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+# Bit-packed SIMD step; falls back to the Numba kernel when the library is
+# missing or the width isn't a multiple of 64
+class GameOfLifeSimd(GameOfLifeNumba):
+    def __init__(self, width=64, height=64):
+        super().__init__(width, height)
+
+        # The C kernel works on whole 64-bit words of cells
+        self.use_simd = _lib is not None and width % 64 == 0
+        self.out_bits = np.zeros((height, (width + 7) // 8), dtype=np.uint8)
+
+        # Scratch space for the kernel, allocated once: the toroidally padded
+        # board (one extra word per side of a row, one extra row top and bottom)
+        # and one row of results
+        words = width // 64
+        self.padded = np.zeros((height + 2) * (words + 2), dtype=np.uint64)
+        self.result = np.zeros(words, dtype=np.uint64)
+
+    @property
+    def alive(self):
+        # count drops the padding bits of a width that isn't a multiple of 8
+        return np.unpackbits(self.alive_bits, axis=1, count=self.width, bitorder="little")
+
+    @alive.setter
+    def alive(self, value):
+        # Keep the board bit-packed: 8 cells per byte, bit x of a row is column x
+        self.alive_bits = np.packbits(value, axis=1, bitorder="little")
+
+    def apply_life_rule_with_fade(self):
+        """Apply Conway's rules with fade effect"""
+        if not self.use_simd:
+            super().apply_life_rule_with_fade()
+            return
+
+        result = _lib.step(
+            self.alive_bits, self.width // 8, self.height,
+            self.out_bits, self.out_fade, self.fade_buffer,
+            FADE_LEVELS - 1, FADE_DECAY_RATE, self.padded, self.result,
+        )
+        if result != 0:
+            raise RuntimeError("gol_simd step failed")
+
+        # Swap buffers
+        self.alive_bits, self.out_bits = self.out_bits, self.alive_bits
+        self.fade_buffer, self.out_fade = self.out_fade, self.fade_buffer
+
+    def count_population(self):
+        """Count fully alive cells"""
+        # Padding bits are always 0, so every set bit is a live cell
+        return int(POPCOUNT[self.alive_bits].sum(dtype=np.int64))
+
+
+if __name__ == "__main__":
+    GameOfLifeSimd(64, 32).run()
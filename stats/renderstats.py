@@ -1,4 +1,9 @@
 import pandas as pd
+import matplotlib
+
+# Non-interactive backend; we only ever save to files
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
@@ -21,23 +26,25 @@ except Exception as e:
     print(f"Error reading file '{csv_filename}': {e}")
     sys.exit(1)
 
-# Convert density from string percentage to float
-df["Density_Float"] = df["Density"].str.rstrip("%").astype(float)
+# Convert density from string percentage to float (float32 is plenty for whole percents)
+df["Density_Float"] = df["Density"].str.rstrip("%").astype(np.float32)
 
-# Get unique board sizes
+# Get unique board sizes, and split the data by board size in one pass
 board_sizes = sorted(df["Board Size"].unique())
+size_groups = df.groupby("Board Size", sort=True)
 
 # Set up the plotting style to match your reference chart
 plt.style.use("default")
 
+# Create the plot once and redraw it for each board size
+fig, ax = plt.subplots(figsize=(10, 6))
+
 # Create a chart for each board size
-for board_size in board_sizes:
-    # Filter data for current board size
-    size_data = df[df["Board Size"] == board_size].copy()
+for board_size, size_data in size_groups:
     size_data = size_data.sort_values("Density_Float")
 
-    # Create the plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Start from a clean set of axes
+    ax.clear()
 
     # Plot P10 and Median lines
     ax.plot(
@@ -60,8 +67,9 @@ for board_size in board_sizes:
     )
 
     # Find max values and their positions
-    max_median_idx = size_data["Median"].idxmax()
-    max_p10_idx = size_data["P10"].idxmax()
+    max_idx = size_data[["Median", "P10"]].idxmax()
+    max_median_idx = max_idx["Median"]
+    max_p10_idx = max_idx["P10"]
 
     max_median_density = size_data.loc[max_median_idx, "Density_Float"]
     max_median_value = size_data.loc[max_median_idx, "Median"]
@@ -180,28 +188,28 @@ for board_size in board_sizes:
     ax.spines["bottom"].set_color("#CCCCCC")
 
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the plot
     filename = f"game_of_life_{sample_size}_samples_{board_size}x{board_size}.png"
-    plt.savefig(
+    fig.savefig(
         filename, dpi=300, bbox_inches="tight", facecolor="white", edgecolor="none"
     )
 
     print(f"Saved chart for board size {board_size} as {filename}")
 
-    # Close the figure to free memory
-    plt.close()
+# Close the figure to free memory
+plt.close(fig)
 
 print(f"\nGenerated charts for board sizes: {board_sizes}")
 
 # Optional: Create a summary statistics table
 print("\nSummary Statistics:")
 print("=" * 60)
-for board_size in board_sizes:
-    size_data = df[df["Board Size"] == board_size]
-    max_median_row = size_data.loc[size_data["Median"].idxmax()]
-    max_p10_row = size_data.loc[size_data["P10"].idxmax()]
+for board_size, size_data in size_groups:
+    max_idx = size_data[["Median", "P10"]].idxmax()
+    max_median_row = size_data.loc[max_idx["Median"]]
+    max_p10_row = size_data.loc[max_idx["P10"]]
 
     print(f"Board Size {board_size}:")
     print(